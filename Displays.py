@@ -55,6 +55,10 @@ class LCDDisplay(Display):
     To connect the display to I2C ID 1 on GPIO pins 2,3
     usage: LCDDisplay(sda=2, scl=3)
     
+    If you know the backpack address (usually 0x27 or 0x3F) pass it in to skip
+    the bus scan at startup
+    usage: LCDDisplay(sda=0, scl=1, addr=0x27)
+    
     To connect via parallel with rs on pin 5, e on pin 4
     and d4,d5,d6,d7 to pins 3,2,1 and 0:
     usage:  LCDDisplay()  # yeah those are the default so you don't need to send
@@ -62,10 +66,11 @@ class LCDDisplay(Display):
     
     """
     
-    def __init__(self, rs=5, e=4, d4=3, d5=2, d6=1, d7=0, *, sda=-1, scl=-1):
+    def __init__(self, rs=5, e=4, d4=3, d5=2, d6=1, d7=0, *, sda=-1, scl=-1, addr=None):
         """
         Combined constructor for the direct-driven displays
         explicitly pass in the sda and scl if you need to use I2C
+        addr is optional - the I2C bus is scanned for the display if not given
         """
         
         if sda < 0:
@@ -91,7 +96,7 @@ class LCDDisplay(Display):
                 raise ValueError('Invalid SDA/SCL pins')
             i2c = I2C(i2cid, sda=Pin(sda), scl=Pin(scl), freq=400000)
             try:
-                I2C_ADDR = i2c.scan()[0]
+                I2C_ADDR = addr if addr is not None else i2c.scan()[0]
                 self._lcd = I2cLcd(i2c, I2C_ADDR, 2, 16)
             except:
                 raise ValueError('Could not connect to display - check wiring.')
@@ -116,6 +121,36 @@ class LCDDisplay(Display):
         else:
             self.showText(f'{" "*16}',line)
 
+    def begin_frame(self):
+        """
+        Start collecting display updates - on I2C displays everything shown
+        until end_frame is sent to the display in a single I2C write.
+        GPIO displays just update as usual. Frames can be nested - only the
+        outermost end_frame sends the updates.
+        """
+
+        if hasattr(self._lcd, 'begin_batch'):
+            self._lcd.begin_batch()
+
+    def end_frame(self):
+        """
+        Send all updates collected since begin_frame
+        """
+
+        if hasattr(self._lcd, 'end_batch'):
+            self._lcd.end_batch()
+
+    def frame(self):
+        """
+        Use in a with block to batch several updates into one I2C write:
+
+        with d.frame():
+            d.showNumbers(12, 30)
+            d.showText('Alarm', 1)
+        """
+
+        return _LCDFrame(self)
+
     def showNumber(self, number, row=0, col=0):
         """
         show a single number
@@ -205,5 +240,23 @@ class LCDDisplay(Display):
             for c in range(16,0,-1):
                 self._lcd.move_to(c-1, row)
                 self._lcd.putchar(curst[c-1])
+            # inside a frame, send each step now so the scroll still animates
+            if hasattr(self._lcd, 'flush_batch'):
+                self._lcd.flush_batch()
             time.sleep(speed/1000)
         self._working = False
+
+class _LCDFrame:
+    """
+    Context manager returned by LCDDisplay.frame()
+    """
+
+    def __init__(self, display):
+        self._display = display
+
+    def __enter__(self):
+        self._display.begin_frame()
+        return self._display
+
+    def __exit__(self, *args):
+        self._display.end_frame()
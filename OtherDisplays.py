@@ -189,11 +189,11 @@ class SevenSegmentDisplayRaw(Display):
         self._sm.active(1)
   
     def _segmentize(self, num):
-        return (
-            self._digits[num % 10] | self._digits[num // 10 % 10] << 8
-            | self._digits[num // 100 % 10] << 16 
-            | self._digits[num // 1000 % 10] << 24 
-        )
+        d = self._digits
+        q, r0 = divmod(num, 10)
+        q, r1 = divmod(q, 10)
+        q, r2 = divmod(q, 10)
+        return d[r0] | d[r1] << 8 | d[r2] << 16 | d[q % 10] << 24
 
     def showNumber(self, n):
         self._sm.put(self._segmentize(n))
@@ -3,6 +3,7 @@
 # A simple Sensor hierarchy for digital and analog sensors
 # Added support for Ultrasonic Sensor on 9/11/23
 # Added support for DHT11/DHT22 sensor on 6/14/24
+# Added optional PIO trigger/echo timing (smid) for UltrasonicSensor on 10/15/26
 # Author: Arijit Sengupta
 """
 
@@ -10,6 +11,9 @@ from machine import Pin, ADC
 import utime
 import math
 import dht
+import micropython
+import rp2
+from rp2 import PIO
 from Log import *
 
 class Sensor:
@@ -53,7 +57,7 @@ class DigitalSensor(Sensor):
     def tripped(self)->bool:
         v = self._pinio.value()
         if (self._lowActive and v == 0) or (not self._lowActive and v == 1):
-            Log.i(f"DigitalSensor {self._name}: sensor tripped")
+            Log.i('%s %s: sensor tripped', type(self).__name__, self._name)
             return True
         else:
             return False
@@ -72,7 +76,7 @@ class TiltSensor(DigitalSensor):
         
     def tripped(self):
         if self._pinio.value() == 1:
-            Log.i(f"TiltSensor {self._name}: sensor tripped")
+            Log.i('%s %s: sensor tripped', type(self).__name__, self._name)
             return True
         else:
             return False
@@ -85,24 +89,45 @@ class AnalogSensor(Sensor):
     We are just going to poll this to keep things simple
     """
     
-    def __init__(self, pin, name='Analog Sensor', lowActive=True, threshold = 30000):
-        """ analog sensors will need to be sent a threshold value to detect trip """
+    def __init__(self, pin, name='Analog Sensor', lowActive=True, threshold = 30000, *, hysteresis=0, poll_delay=0):
+        """
+        analog sensors will need to be sent a threshold value to detect trip
+
+        hysteresis only affects untripping - the sensor still trips at threshold,
+        but once tripped, the value has to move back past threshold by that much
+        to untrip. This keeps noisy sensors from flickering. poll_delay (ms)
+        reuses the last ADC reading until it is that old, so tight loops do
+        not hit the ADC every time.
+        """
         
         super().__init__(pin, name, lowActive)
         self._pinio = ADC(self._pin)
         self._threshold = threshold
+        self._hysteresis = hysteresis
+        self._poll_delay = poll_delay
+        self._last_poll_time = 0
+        self._last_value = None
+        self._tripped = False
 
     def tripped(self)->bool:
         """ sensor is tripped if sensor value is higher or lower than threshold """
         
+        lo, th = self._lowActive, self._threshold
+        band = self._hysteresis if self._tripped else 0
         v = self.rawValue()
-        if (self._lowActive and v < self._threshold) or (not self._lowActive and v > self._threshold):
-            Log.i(f"AnalogSensor {self._name}: sensor tripped")
-            return True
-        else:
-            return False
+        tripped = v < th + band if lo else v > th - band
+        self._tripped = tripped
+        if tripped:
+            Log.i('%s %s: sensor tripped', type(self).__name__, self._name)
+        return tripped
 
     def rawValue(self):
+        if self._poll_delay:
+            now = utime.ticks_ms()
+            if self._last_value is None or utime.ticks_diff(now, self._last_poll_time) >= self._poll_delay:
+                self._last_value = self._pinio.read_u16()
+                self._last_poll_time = now
+            return self._last_value
         return self._pinio.read_u16()
 
 class TempSensor(AnalogSensor):
@@ -113,14 +138,15 @@ class TempSensor(AnalogSensor):
     are what matters.
     """
     
-    def __init__(self, pin, name='Temp Sensor', lowActive=False, threshold=60):
+    def __init__(self, pin, name='Temp Sensor', lowActive=False, threshold=60, *, hysteresis=0, poll_delay=0):
         """
         Create a new temp sensor - similar to regular analog sensor
         but now tripped will return true when temp is lower than threshold (lowActive=True)
         and higher than threshold (lowActive=False)
+        hysteresis (degrees) and poll_delay (ms) work as in AnalogSensor
         """
         
-        super().__init__(pin, name, lowActive, threshold)
+        super().__init__(pin, name, lowActive, threshold, hysteresis=hysteresis, poll_delay=poll_delay)
         
     def rawValue(self):
         """
@@ -151,40 +177,86 @@ class UltrasonicSensor(Sensor):
     so when distance is < 10cm, it will return true for tripped.
     """
 
-    def __init__(self, *, trigger=0, echo=1, name='Ultrasonic', lowActive = True, threshold=10.0):
+    def __init__(self, *, trigger=0, echo=1, name='Ultrasonic', lowActive = True, threshold=10.0, smid=None):
+        """
+        Pass a state machine id in smid (0-7) to let the PIO generate the trigger
+        pulse and time the echo in hardware. Otherwise the pulse is bit-banged.
+        """
+
         super().__init__(trigger, name, lowActive)
         self._trigger = Pin(trigger, Pin.OUT)
         self._echo = Pin(echo, Pin.IN)
         self._threshold = threshold
+        self._sm = None
+        if smid is not None:
+            self._sm = rp2.StateMachine(smid, ultrasonic, freq=2000000,
+                                        set_base=self._trigger, in_base=self._echo,
+                                        jmp_pin=self._echo)
+            self._sm.active(1)
+
+    @micropython.native
+    def _pulse(self):
+        """ Send the 5us trigger pulse - native so the sleeps are not swallowed by the interpreter """
+
+        trig = self._trigger
+        trig.off()
+        utime.sleep_us(2)
+        trig.on()
+        utime.sleep_us(5)
+        trig.off()
 
     def getDistance(self)->float:
         """ Get the distance of obstacle from the sensor in cm """
         
-        self._trigger.off()
-        utime.sleep_us(2)
-        self._trigger.on()
-        utime.sleep_us(5)
-        self._trigger.off()
-        while self._echo.value() == 0:
-            signaloff = utime.ticks_us()
-        while self._echo.value() == 1:
-            signalon = utime.ticks_us()
-        timepassed = signalon - signaloff
+        if self._sm is not None:
+            # PIO counts down from 0xFFFFFFFF once per microsecond while echo is high
+            self._sm.put(0xFFFFFFFF)
+            timepassed = 0xFFFFFFFF - self._sm.get()
+        else:
+            self._pulse()
+            while self._echo.value() == 0:
+                signaloff = utime.ticks_us()
+            while self._echo.value() == 1:
+                signalon = utime.ticks_us()
+            timepassed = signalon - signaloff
         distance = (timepassed * 0.0343) / 2
         return distance
 
     def tripped(self)->bool:
         """ sensor is tripped if distance is higher or lower than threshold """
         
+        lo, th = self._lowActive, self._threshold
         v = self.getDistance()
-        if (self._lowActive and v < self._threshold) or (not self._lowActive and v > self._threshold):
-            Log.i(f"UltrasonicSensor {self._name}: sensor tripped")
-            return True
-        else:
-            return False
+        tripped = v < th if lo else v > th
+        if tripped:
+            Log.i('%s %s: sensor tripped', type(self).__name__, self._name)
+        return tripped
+
+# Internals used by the PIO state machine
+# THIS IS REQUIRED FOR THE ULTRASONIC SENSOR when smid is passed
+# Runs at 2MHz: the trigger is held high for 10 cycles (5us) and
+# the counting loop is 2 cycles (1us) per decrement of x
+@rp2.asm_pio(set_init=PIO.OUT_LOW)
+def ultrasonic():
+    pull()                          # wait for a request - osr holds the start count
+    mov(x, osr)
+    set(pins, 0)            [3]     # 2us low
+    set(pins, 1)            [9]     # 5us trigger pulse
+    set(pins, 0)
+    wait(1, pin, 0)                 # wait for the echo to go high
+    label("count")
+    jmp(pin, "high")
+    jmp("done")
+    label("high")
+    jmp(x_dec, "count")
+    label("done")
+    mov(isr, x)
+    push()
 
 # DHT11/DHT22 Sensor
 class DHTSensor(DigitalSensor):
+    _TYPES = {'DHT11': dht.DHT11, 'DHT22': dht.DHT22}
+
     def __init__(self, pin, name='DHT', lowActive=False, threshold=60, poll_delay=2000, sensor_type='DHT11'):
         """
         Create a new DHT sensor - similar to regular digital sensor but can take
@@ -204,8 +276,10 @@ class DHTSensor(DigitalSensor):
         
         super().__init__(pin, name, lowActive)
         self._sensor_type = sensor_type
-        self._sensor_class = dht.DHT11 if sensor_type == "DHT11" else dht.DHT22
-        self._dht_sensor = self._sensor_class(Pin(self._pin))
+        # anything other than DHT11 is driven as a DHT22 (AM2302, DHT21...)
+        self._sensor_class = self._TYPES.get(sensor_type, dht.DHT22)
+        # reuse the Pin created by DigitalSensor rather than wrapping the pin again
+        self._dht_sensor = self._sensor_class(self._pinio)
         self._last_poll_time = 0
         self._poll_delay = poll_delay
         self._threshold = threshold
@@ -245,7 +319,9 @@ class DHTSensor(DigitalSensor):
         Sensor is tripped if temperature is higher or lower than threshold
         """
         
-        if self._lowActive:
-            return self.getTemperature() < self._threshold
-        else:
-            return self.getTemperature() >= self._threshold
+        lo, th = self._lowActive, self._threshold
+        v = self.getTemperature()
+        tripped = v < th if lo else v >= th
+        if tripped:
+            Log.i('%s %s: sensor tripped', type(self).__name__, self._name)
+        return tripped
@@ -35,6 +35,10 @@ class SevenSegSingle:
     d = SevenSegSingle(dataPin=25, clockPin=26, latchPin=27, commonCathode=False)
     """
 
+    # Segment patterns for 0-9, bit 7 is segment A down to bit 1 for G, bit 0 is DP
+    # Shared by all instances - common anode displays invert them with self._invert
+    _patterns = (0xFC, 0x60, 0xDA, 0xF2, 0x66, 0xB6, 0xBE, 0xE0, 0xFE, 0xF6)
+
     def __init__(self, A=0, B=1, C=2, D=3, E=4, F=5, G=6,
                      commonCathode=True, *, dataPin=None, clockPin=None, latchPin=None):
         """
@@ -43,9 +47,8 @@ class SevenSegSingle:
         """
   
         pinarray = [A, B, C, D, E, F, G]
-        self._digitcodes = ["11111100", "01100000", "11011010", "11110010", "01100110",
-                                "10110110", "10111110", "11100000", "11111110", "11110110"]
         self.commcathode = commonCathode
+        self._invert = 0 if commonCathode else 0xFF
         self._parallelPins = []
         if dataPin is None:
             for p in range(0, 7):
@@ -65,19 +68,18 @@ class SevenSegSingle:
             raise ValueError('This class can only display a number between 0-9')
         else:
             if self._data is None:
-                self._parallel_update(self._digitcodes[n])
+                self._parallel_update(self._patterns[n])
             else:
-                self._shift_update(self._digitcodes[n])
+                self._shift_update(self._patterns[n])
 
-    def _valueOf(self, val)->int:
-        if self.commcathode:
-            return int(val)
-        else:
-            return 0 if int(val) == 1 else 1 
+    def _valueOf(self, pattern, i)->int:
+        """ value to send for segment i (0 is A, 7 is DP) of a pattern """
+
+        return ((pattern >> (7 - i)) & 1) ^ (self._invert & 1)
 
     def _parallel_update(self, input):
         for i in range(0,7):
-            self._parallelPins[i].value(self._valueOf(input[i])) 
+            self._parallelPins[i].value(self._valueOf(input, i))
 
     def _shift_update(self, input):
         #put latch down to start data sending
@@ -85,11 +87,13 @@ class SevenSegSingle:
         self._latch.value(0)
         self._clock.value(1)
 
-        #load data in reverse order
-        for i in range(7, -1, -1):
+        #load data in reverse order - DP (bit 0) goes out first
+        v = input ^ self._invert
+        for _ in range(8):
             self._clock.value(0)
-            self._data.value(self._valueOf(input[i]))
+            self._data.value(v & 1)
             self._clock.value(1)
+            v >>= 1
 
         #put latch up to store data on register
         self._clock.value(0)
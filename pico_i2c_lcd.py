@@ -22,6 +22,8 @@ class I2cLcd(LcdApi):
     def __init__(self, i2c, i2c_addr, num_lines, num_columns):
         self.i2c = i2c
         self.i2c_addr = i2c_addr
+        self._batch = None   # bytearray while batching writes, see begin_batch
+        self._batch_depth = 0
         self.i2c.writeto(self.i2c_addr, bytes([0]))
         utime.sleep_ms(20)   # Allow LCD time to powerup
         # Send reset 3 times
@@ -51,24 +53,68 @@ class I2cLcd(LcdApi):
         
     def hal_backlight_on(self):
         # Allows the hal layer to turn the backlight on
+        if self._batch is not None:
+            # queue it so it stays in order with earlier batched writes
+            self._batch.append(1 << SHIFT_BACKLIGHT)
+            return
         self.i2c.writeto(self.i2c_addr, bytes([1 << SHIFT_BACKLIGHT]))
         gc.collect()
         
     def hal_backlight_off(self):
         #Allows the hal layer to turn the backlight off
+        if self._batch is not None:
+            self._batch.append(0)
+            return
         self.i2c.writeto(self.i2c_addr, bytes([0]))
         gc.collect()
+
+    def hal_sleep_us(self, usecs):
+        # Send anything batched first so the delay happens between writes
+        # (custom_char relies on this between CGRAM bytes)
+        self.flush_batch()
+        utime.sleep_us(usecs)
         
+    def begin_batch(self):
+        # Collect expander writes instead of sending them one at a time.
+        # The PCF8574 latches each byte of a multi-byte write in turn, so
+        # the whole batch can go out in a single I2C transaction.
+        # Batches nest - only the outermost end_batch sends the data.
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self._batch = bytearray()
+
+    def flush_batch(self):
+        # Send what has been collected so far but keep batching
+        if self._batch:
+            self.i2c.writeto(self.i2c_addr, self._batch)
+            self._batch = bytearray()
+
+    def end_batch(self):
+        # Send everything collected since the outermost begin_batch in one write
+        if self._batch_depth == 0:
+            return
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush_batch()
+            self._batch = None
+
     def hal_write_command(self, cmd):
         # Write a command to the LCD. Data is latched on the falling edge of E.
         byte = ((self.backlight << SHIFT_BACKLIGHT) |
                 (((cmd >> 4) & 0x0f) << SHIFT_DATA))
-        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
-        self.i2c.writeto(self.i2c_addr, bytes([byte]))
-        byte = ((self.backlight << SHIFT_BACKLIGHT) |
+        byte2 = ((self.backlight << SHIFT_BACKLIGHT) |
                 ((cmd & 0x0f) << SHIFT_DATA))
+        if self._batch is not None:
+            self._batch.extend(bytes((byte | MASK_E, byte, byte2 | MASK_E, byte2)))
+            if cmd <= 3:
+                # flush so the delay happens after the command is sent
+                self.flush_batch()
+                utime.sleep_ms(5)
+            return
         self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
         self.i2c.writeto(self.i2c_addr, bytes([byte]))
+        self.i2c.writeto(self.i2c_addr, bytes([byte2 | MASK_E]))
+        self.i2c.writeto(self.i2c_addr, bytes([byte2]))
         if cmd <= 3:
             # The home and clear commands require a worst case delay of 4.1 msec
             utime.sleep_ms(5)
@@ -79,11 +125,14 @@ class I2cLcd(LcdApi):
         byte = (MASK_RS |
                 (self.backlight << SHIFT_BACKLIGHT) |
                 (((data >> 4) & 0x0f) << SHIFT_DATA))
-        self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
-        self.i2c.writeto(self.i2c_addr, bytes([byte]))
-        byte = (MASK_RS |
+        byte2 = (MASK_RS |
                 (self.backlight << SHIFT_BACKLIGHT) |
                 ((data & 0x0f) << SHIFT_DATA))      
+        if self._batch is not None:
+            self._batch.extend(bytes((byte | MASK_E, byte, byte2 | MASK_E, byte2)))
+            return
         self.i2c.writeto(self.i2c_addr, bytes([byte | MASK_E]))
         self.i2c.writeto(self.i2c_addr, bytes([byte]))
+        self.i2c.writeto(self.i2c_addr, bytes([byte2 | MASK_E]))
+        self.i2c.writeto(self.i2c_addr, bytes([byte2]))
         gc.collect()
\ No newline at end of file